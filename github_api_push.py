@@ -1,68 +1,497 @@
 #!/usr/bin/env python3
 
 import os
-import requests
+import asyncio
+import aiohttp
 import base64
+import hashlib
 import json
-from pathlib import Path
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from tqdm import tqdm
 
-def get_file_content(file_path):
-    """Read file content and encode it"""
+GITHUB_API = "https://api.github.com"
+BRANCH = "main"
+MAX_CONCURRENCY = 10
+MAX_RETRIES = 5
+REQUEST_TIMEOUT = 30
+# Minimum pause after a secondary rate limit, and the wait worth telling the user about
+SECONDARY_LIMIT_WAIT = 60
+LONG_WAIT_NOTICE = 10
+# Marker from get_branch_head() for a branch that does not exist yet
+MISSING_BRANCH = object()
+# Paths buffered between the directory walk and the upload workers
+QUEUE_SIZE = 256
+# Threads for file reads and hashing, overlapping disk I/O with uploads
+FILE_IO_WORKERS = 8
+# Content type for the hand-built JSON of streamed blob bodies
+JSON_HEADERS = {'Content-Type': 'application/json'}
+# Change sets up to this size are committed inline in a single GraphQL mutation
+GRAPHQL_MAX_FILES = 100
+GRAPHQL_MAX_BYTES = 5 * 1024 * 1024
+# Largest multiple of 3 under 64 KB, so chunks encode without base64 padding
+B64_CHUNK_SIZE = 57 * 1024
+HASH_CHUNK_SIZE = 1 << 20
+# Text files up to this size are uploaded as UTF-8 instead of base64
+TEXT_MAX_BYTES = 1 << 20
+BINARY_SNIFF_BYTES = 8192
+
+CREATE_COMMIT_MUTATION = """
+mutation ($input: CreateCommitOnBranchInput!) {
+  createCommitOnBranch(input: $input) {
+    commit { oid }
+  }
+}
+"""
+
+IGNORE_PATTERNS = [
+    'node_modules/', '.git/', '.env', '.env.*', '*.env', '*.log', 'dist/', 'build/',
+    '.DS_Store', '*.tar.gz', '.cache/', '.vscode/', '.idea/',
+    '__pycache__/', '*.pyc', '.replit', 'repl.nix'
+]
+
+def iter_b64(file_path, chunk_size=B64_CHUNK_SIZE):
+    """Read a file in chunks and yield its base64 encoding piece by piece"""
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            yield base64.b64encode(chunk)
+
+def read_b64(file_path):
+    """Read a whole file and return its base64 encoding as a string"""
+    return b''.join(iter_b64(file_path)).decode('ascii')
+
+async def blob_body(f, executor):
+    """Stream the JSON body of a blob upload from an open file without loading it whole
+    
+    The file is rewound first so a retried request sends it again from the start.
+    Seeks and reads run on the executor so disk I/O never blocks the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, f.seek, 0)
+    yield b'{"encoding": "base64", "content": "'
+    while chunk := await loop.run_in_executor(executor, f.read, B64_CHUNK_SIZE):
+        yield base64.b64encode(chunk)
+    yield b'"}'
+
+def glob_to_regex(pattern):
+    """Translate a .gitignore-style name glob into a regex matching the whole name"""
+    return ''.join(
+        '[^/]*' if c == '*' else '[^/]' if c == '?' else re.escape(c)
+        for c in pattern
+    )
+
+def compile_ignore_patterns(patterns):
+    """Sort ignore patterns into the cheapest check that can handle each of them
+    
+    Returns directory names to prune during the walk, exact names, "*.ext" suffixes
+    for a single str.endswith(tuple) call, and one regex alternation for any other
+    globs (None if there are none).
+    """
+    dirs, names, suffixes, globs = set(), set(), [], []
+    for pattern in patterns:
+        if pattern.endswith('/'):
+            dirs.add(pattern[:-1])
+        elif '*' not in pattern and '?' not in pattern:
+            names.add(pattern)
+        elif pattern.startswith('*') and '*' not in pattern[1:] and '?' not in pattern[1:]:
+            suffixes.append(pattern[1:])
+        else:
+            globs.append(glob_to_regex(pattern))
+    regex = re.compile('|'.join(globs)) if globs else None
+    return frozenset(dirs), frozenset(names), tuple(suffixes), regex
+
+IGNORE_DIRS, IGNORE_NAMES, IGNORE_SUFFIXES, IGNORE_RE = compile_ignore_patterns(IGNORE_PATTERNS)
+
+def git_blob_sha(file_path):
+    """Compute the SHA git assigns to a blob with the file's content, reading it in chunks"""
+    sha = hashlib.sha1(b"blob %d\0" % os.path.getsize(file_path))
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def should_ignore_name(name):
+    """Check if a file or directory name matches one of the non-directory ignore patterns"""
+    return (
+        name in IGNORE_NAMES
+        or name.endswith(IGNORE_SUFFIXES)
+        or (IGNORE_RE is not None and IGNORE_RE.fullmatch(name) is not None)
+    )
+
+def get_retry_delay(response, body, delay):
+    """Return how long to wait before retrying a response, or None if it should not be retried"""
+    if response.status in (403, 429):
+        # X-RateLimit-Reset is sent on every response, so it only matters
+        # once the primary limit is actually used up
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = response.headers.get('X-RateLimit-Reset')
+            return max(int(reset) - time.time(), delay) if reset else delay
+        # Every 429, and any 403 that says when to come back, is retried
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                return max(delay, SECONDARY_LIMIT_WAIT)
+        if response.status == 429 or 'secondary rate limit' in body.lower():
+            # GitHub asks for at least a minute's pause after a secondary limit without Retry-After
+            return max(delay, SECONDARY_LIMIT_WAIT)
+        return None
+    if response.status >= 500:
+        return delay
+    return None
+
+async def github_request(session, method, url, body_factory=None, **kwargs):
+    """Send a GitHub API request, waiting out rate limits and retrying server errors.
+    
+    Streamed bodies cannot be replayed, so pass body_factory to build a fresh one per attempt.
+    Returns the response status and its parsed JSON body (None if the body is not JSON).
+    """
+    delay = 1
+    for attempt in range(MAX_RETRIES + 1):
+        if body_factory is not None:
+            kwargs['data'] = body_factory()
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                body = await response.text()
+                wait = get_retry_delay(response, body, delay)
+                if wait is None or attempt == MAX_RETRIES:
+                    try:
+                        return response.status, json.loads(body)
+                    except ValueError:
+                        return response.status, None
+        except aiohttp.ClientError:
+            if attempt == MAX_RETRIES:
+                raise
+            wait = delay
+        
+        if wait >= LONG_WAIT_NOTICE:
+            tqdm.write(f"⏳ Rate limited by GitHub, waiting {wait:.0f}s before retrying...")
+        await asyncio.sleep(wait + random.uniform(0, 0.5))
+        delay *= 2
+
+async def get_branch_head(session, repo_api):
+    """Get the commit SHA and tree SHA the main branch points at
+    
+    Returns (None, None) if they cannot be read, or (None, MISSING_BRANCH) if the
+    branch does not exist yet (GitHub answers 409 for a repository with no commits).
+    """
+    status, ref = await github_request(session, 'GET', f"{repo_api}/git/ref/heads/{BRANCH}")
+    if status in (404, 409):
+        return None, MISSING_BRANCH
+    if status != 200:
+        return None, None
+    commit_sha = ref['object']['sha']
+    
+    status, commit = await github_request(session, 'GET', f"{repo_api}/git/commits/{commit_sha}")
+    if status != 200:
+        return None, None
+    return commit_sha, commit['tree']['sha']
+
+async def seed_empty_branch(session, repo_api, repo_name):
+    """Create the first commit of an empty repository, which the Git Data API cannot write to
+    
+    Uses one Contents API PUT of the project's README.md (or a one-line README if there
+    is none), so the normal push afterwards finds it unchanged.
+    """
     try:
-        with open(file_path, 'rb') as f:
+        with open('README.md', 'rb') as f:
             content = f.read()
-        return base64.b64encode(content).decode('utf-8')
-    except Exception as e:
-        print(f"❌ Error reading {file_path}: {e}")
+    except OSError:
+        content = f"# {repo_name}\n".encode('utf-8')
+    
+    data = {
+        'message': 'Initial commit',
+        'content': base64.b64encode(content).decode('ascii'),
+        'branch': BRANCH
+    }
+    status, _ = await github_request(session, 'PUT', f"{repo_api}/contents/README.md", json=data)
+    if status != 201:
+        print(f"❌ Could not create the initial commit: {status}")
+        return False
+    return True
+
+async def get_remote_blob_shas(session, repo_api, tree_sha):
+    """Map every file path on the branch to its blob SHA with one recursive tree listing"""
+    status, tree = await github_request(
+        session, 'GET', f"{repo_api}/git/trees/{tree_sha}", params={'recursive': '1'}
+    )
+    if status != 200:
+        return {}
+    if tree.get('truncated'):
+        print("⚠️ Remote tree listing is truncated, some unchanged files may be re-uploaded")
+    return {entry['path']: entry['sha'] for entry in tree['tree'] if entry['type'] == 'blob'}
+
+def is_unchanged(file_path, remote_shas):
+    """Check if the file's content already matches the blob on the branch"""
+    remote_sha = remote_shas.get(file_path)
+    if remote_sha is None:
+        return False
+    try:
+        return git_blob_sha(file_path) == remote_sha
+    except OSError:
+        return False
+
+async def walk_files(queue, project_root, worker_count):
+    """Walk the project and feed the repository path of every file that is not ignored into the queue"""
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        # Prune ignored directories so their subtrees are never listed,
+        # which leaves only name checks for the files themselves
+        dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS and not should_ignore_name(d)]
+        # Forward-slash repository paths double as local paths relative to the project root
+        prefix = dirpath[len(project_root) + 1:].replace(os.sep, '/')
+        if prefix:
+            prefix += '/'
+        for filename in filenames:
+            if not should_ignore_name(filename):
+                await queue.put(prefix + filename)
+        # Let the workers run between directories even while the queue has room
+        await asyncio.sleep(0)
+    
+    # One stop marker per worker
+    for _ in range(worker_count):
+        await queue.put(None)
+
+def read_text(file_path):
+    """Return the file's content as a string if it is small UTF-8 text, otherwise None"""
+    if os.path.getsize(file_path) > TEXT_MAX_BYTES:
+        return None
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    # A NUL byte near the start means binary; skip the decode attempt
+    if b'\x00' in content[:BINARY_SNIFF_BYTES]:
+        return None
+    try:
+        return content.decode('utf-8')
+    except UnicodeDecodeError:
         return None
 
-def should_ignore_file(file_path):
-    """Check if file should be ignored based on .gitignore patterns"""
-    ignore_patterns = [
-        'node_modules/', '.git/', '.env', '*.log', 'dist/', 'build/',
-        '.DS_Store', '*.tar.gz', '.cache/', '.vscode/', '.idea/',
-        '__pycache__/', '*.pyc', '.replit', 'repl.nix'
-    ]
+async def create_blob(session, executor, blobs_url, text, f):
+    """Upload file content as a blob and return its SHA
     
-    file_str = str(file_path)
-    for pattern in ignore_patterns:
-        if pattern.endswith('/'):
-            if f'/{pattern[:-1]}/' in file_str or file_str.startswith(pattern[:-1] + '/'):
-                return True
-        elif pattern.startswith('*.'):
-            if file_str.endswith(pattern[1:]):
-                return True
-        elif pattern in file_str:
-            return True
-    return False
+    Small UTF-8 text files are passed as text and sent as-is to avoid the base64
+    size overhead, everything else is passed as an open binary file and streamed as base64.
+    """
+    if text is not None:
+        data = {
+            'content': text,
+            'encoding': 'utf-8'
+        }
+        status, blob = await github_request(session, 'POST', blobs_url, json=data)
+    else:
+        status, blob = await github_request(
+            session, 'POST', blobs_url,
+            body_factory=lambda: blob_body(f, executor),
+            headers=JSON_HEADERS
+        )
+    if status != 201:
+        return None
+    return blob['sha']
 
-def create_or_update_file(owner, repo, token, file_path, content, message):
-    """Create or update a file in GitHub repository"""
-    url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
-    headers = {
-        'Authorization': f'token {token}',
-        'Accept': 'application/vnd.github.v3+json'
+def file_mode(file_path):
+    """Return the git tree mode for a file, keeping the executable bit"""
+    return '100755' if os.access(file_path, os.X_OK) else '100644'
+
+async def upload_file(session, executor, semaphore, blobs_url, file_path):
+    """Upload one file as a blob and return its tree entry"""
+    loop = asyncio.get_running_loop()
+    async with semaphore:
+        # Only opening and reading the file is guarded here, network errors go to the caller
+        try:
+            mode = await loop.run_in_executor(executor, file_mode, file_path)
+            text = await loop.run_in_executor(executor, read_text, file_path)
+            f = None if text is not None else await loop.run_in_executor(executor, open, file_path, 'rb')
+        except OSError as e:
+            tqdm.write(f"❌ Error reading {file_path}: {e}")
+            return None
+        
+        try:
+            blob_sha = await create_blob(session, executor, blobs_url, text, f)
+        finally:
+            if f is not None:
+                f.close()
+        if blob_sha is None:
+            tqdm.write(f"  ❌ Upload failed: {file_path}")
+            return None
+        
+        return {
+            'path': file_path,
+            'mode': mode,
+            'type': 'blob',
+            'sha': blob_sha
+        }
+
+async def commit_tree(session, repo_api, base_commit_sha, base_tree_sha, tree_entries, message):
+    """Create one tree and commit on top of the base commit and move main to it"""
+    tree_data = {
+        'base_tree': base_tree_sha,
+        'tree': tree_entries
     }
+    status, tree = await github_request(session, 'POST', f"{repo_api}/git/trees", json=tree_data)
+    if status != 201:
+        print(f"❌ Could not create tree: {status}")
+        return None
+    tree_sha = tree['sha']
     
-    # Check if file exists
-    response = requests.get(url, headers=headers)
-    
-    data = {
+    commit_data = {
         'message': message,
-        'content': content,
-        'branch': 'main'
+        'tree': tree_sha,
+        'parents': [base_commit_sha]
     }
+    status, commit = await github_request(session, 'POST', f"{repo_api}/git/commits", json=commit_data)
+    if status != 201:
+        print(f"❌ Could not create commit: {status}")
+        return None
+    commit_sha = commit['sha']
+    
+    status, _ = await github_request(session, 'PATCH', f"{repo_api}/git/refs/heads/{BRANCH}", json={'sha': commit_sha})
+    if status != 200:
+        print(f"❌ Could not update {BRANCH}: {status}")
+        return None
+    return commit_sha
+
+async def commit_via_graphql(session, executor, repository, base_commit_sha, files, message):
+    """Commit files with one createCommitOnBranch mutation, returning the file count"""
+    loop = asyncio.get_running_loop()
+    reads = [loop.run_in_executor(executor, read_b64, file_path) for file_path in files]
+    results = await asyncio.gather(*reads, return_exceptions=True)
+    
+    additions = []
+    for file_path, contents in zip(files, results):
+        if isinstance(contents, OSError):
+            print(f"❌ Error reading {file_path}: {contents}")
+            continue
+        if isinstance(contents, Exception):
+            raise contents
+        additions.append({
+            'path': file_path,
+            'contents': contents
+        })
+    
+    if not additions:
+        return 0
+    
+    variables = {
+        'input': {
+            'branch': {
+                'repositoryNameWithOwner': repository,
+                'branchName': BRANCH
+            },
+            'message': {'headline': message},
+            'fileChanges': {'additions': additions},
+            'expectedHeadOid': base_commit_sha
+        }
+    }
+    status, result = await github_request(
+        session, 'POST', f"{GITHUB_API}/graphql",
+        json={'query': CREATE_COMMIT_MUTATION, 'variables': variables}
+    )
+    if status != 200 or not result or result.get('errors'):
+        errors = result.get('errors') if result else None
+        print(f"❌ Could not create commit: {status} {errors or ''}")
+        return 0
+    return len(additions)
+
+async def push_changes(session, executor, repo_api, repository, base_commit_sha, base_tree_sha, message):
+    """Walk, diff and upload the project as one streaming pipeline, then commit the changes
+    
+    A walker feeds paths through a bounded queue to MAX_CONCURRENCY workers, so the
+    first upload starts while the walk is still running. Changed files are held back
+    while they still fit in a single GraphQL mutation; once they outgrow it, every
+    changed file is uploaded as a blob and committed as one tree instead.
+    All disk reads and hashing run on the executor, overlapping with network I/O.
+    Returns the number of files scanned, changed and committed.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    walker = asyncio.create_task(walk_files(queue, ".", MAX_CONCURRENCY))
+    
+    # Fetched while the walker fills the queue
+    remote_shas = await get_remote_blob_shas(session, repo_api, base_tree_sha)
+    # Built once here rather than for every uploaded file
+    blobs_url = f"{repo_api}/git/blobs"
+    
+    scanned = 0
+    changed = 0
+    pending = []
+    pending_bytes = 0
+    use_blobs = False
+    tree_entries = []
+    
+    async def upload(file_path):
+        try:
+            entry = await upload_file(session, executor, semaphore, blobs_url, file_path)
+        except Exception as e:
+            tqdm.write(f"  ❌ Upload failed: {file_path} ({e})")
+            return
+        if entry is not None:
+            tree_entries.append(entry)
+    
+    async def process(file_path):
+        nonlocal changed, pending, pending_bytes, use_blobs
+        # hashlib releases the GIL while hashing, so threads scale with cores
+        if await loop.run_in_executor(executor, is_unchanged, file_path, remote_shas):
+            return
+        changed += 1
+        # GraphQL additions carry no file mode, so executables always go through blobs.
+        # Checked before use_blobs: no await may separate that check from the pending update
+        executable = await loop.run_in_executor(executor, file_mode, file_path) == '100755'
+        
+        if use_blobs:
+            await upload(file_path)
+            return
+        try:
+            size = os.path.getsize(file_path)
+        except OSError as e:
+            tqdm.write(f"❌ Error reading {file_path}: {e}")
+            return
+        fits = len(pending) < GRAPHQL_MAX_FILES and pending_bytes + size <= GRAPHQL_MAX_BYTES
+        if fits and not executable:
+            pending.append(file_path)
+            pending_bytes += size
+            return
+        
+        # Too much for one mutation (or an executable): switch to blobs and flush what was held back
+        use_blobs = True
+        flushed, pending = pending + [file_path], []
+        await asyncio.gather(*(upload(path) for path in flushed))
+    
+    async def worker(progress):
+        nonlocal scanned
+        while (file_path := await queue.get()) is not None:
+            scanned += 1
+            try:
+                await process(file_path)
+            finally:
+                progress.update(1)
+    
+    # One throttled progress bar instead of a line per file
+    with tqdm(unit=' files', desc='📤 Processing') as progress:
+        workers = [worker(progress) for _ in range(MAX_CONCURRENCY)]
+        await asyncio.gather(walker, *workers)
     
-    if response.status_code == 200:
-        # File exists, need SHA for update
-        file_info = response.json()
-        data['sha'] = file_info['sha']
+    if not use_blobs:
+        if not pending:
+            return scanned, changed, 0
+        print(f"📤 Committing {len(pending)} files in a single GraphQL mutation...")
+        committed = await commit_via_graphql(session, executor, repository, base_commit_sha, pending, message)
+        return scanned, changed, committed
     
-    # Create or update file
-    response = requests.put(url, headers=headers, json=data)
-    return response.status_code in [200, 201]
+    if not tree_entries:
+        return scanned, changed, 0
+    
+    # Commit all uploaded blobs at once
+    print()
+    print(f"📋 Committing {len(tree_entries)} files to {BRANCH}...")
+    if await commit_tree(session, repo_api, base_commit_sha, base_tree_sha, tree_entries, message) is None:
+        return scanned, changed, 0
+    return scanned, changed, len(tree_entries)
 
-def push_to_github():
+async def push_to_github():
     """Push all files to GitHub using GitHub API"""
     
     print("🚀 AJAI Trading Platform - GitHub API Push")
@@ -80,60 +509,71 @@ def push_to_github():
     print(f"📂 Repository: {github_owner}/{github_repo}")
     print()
     
-    # Create repository if it doesn't exist
-    create_repo_url = f"https://api.github.com/user/repos"
-    create_headers = {
+    headers = {
         'Authorization': f'token {github_token}',
         'Accept': 'application/vnd.github.v3+json'
     }
+    repo_api = f"{GITHUB_API}/repos/{github_owner}/{github_repo}"
     
-    repo_data = {
-        'name': github_repo,
-        'description': '🚀 AJAI - AI-Powered Trading Platform with Real-time Market Analysis',
-        'private': False,
-        'auto_init': True
-    }
-    
-    print("📋 Checking/creating repository...")
-    create_response = requests.post(create_repo_url, headers=create_headers, json=repo_data)
-    if create_response.status_code == 201:
-        print("✅ Repository created successfully")
-    elif create_response.status_code == 422:
-        print("✅ Repository already exists")
-    else:
-        print("✅ Repository accessible")
-    
-    # Get all files in the project
-    project_root = Path(".")
-    all_files = []
-    
-    for file_path in project_root.rglob("*"):
-        if file_path.is_file() and not should_ignore_file(file_path):
-            relative_path = file_path.relative_to(project_root)
-            all_files.append(relative_path)
-    
-    print(f"📋 Found {len(all_files)} files to upload...")
-    print()
-    
-    # Upload files
-    success_count = 0
-    total_files = len(all_files)
-    
-    for i, file_path in enumerate(all_files, 1):
-        print(f"📤 Uploading ({i}/{total_files}): {file_path}")
-        
-        content = get_file_content(file_path)
-        if content is None:
-            continue
+    # One session for every request so TCP/TLS connections and auth headers are reused
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY, keepalive_timeout=60, ttl_dns_cache=300)
+    # Bound connecting and stalled reads, but not the total time of a large upload
+    timeout = aiohttp.ClientTimeout(total=None, connect=REQUEST_TIMEOUT, sock_read=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, headers=headers, timeout=timeout) as session:
+        # Create repository if it doesn't exist; a read is cheaper than a
+        # rate-limited write that fails with 422 on every run
+        print("📋 Checking/creating repository...")
+        repo_status, _ = await github_request(session, 'GET', repo_api)
+        if repo_status == 200:
+            print("✅ Repository already exists")
+        elif repo_status == 404:
+            create_repo_url = f"{GITHUB_API}/user/repos"
             
-        github_path = str(file_path).replace('\\', '/')
-        message = f"Update {github_path}"
-        
-        if create_or_update_file(github_owner, github_repo, github_token, github_path, content, message):
-            success_count += 1
-            print(f"  ✅ Uploaded successfully")
+            repo_data = {
+                'name': github_repo,
+                'description': '🚀 AJAI - AI-Powered Trading Platform with Real-time Market Analysis',
+                'private': False,
+                'auto_init': True
+            }
+            
+            create_status, _ = await github_request(session, 'POST', create_repo_url, json=repo_data)
+            if create_status == 201:
+                print("✅ Repository created successfully")
+            else:
+                print(f"⚠️ Could not create repository: {create_status}")
+        elif repo_status in (401, 403):
+            print(f"❌ Could not access repository: {repo_status} (check GITHUB_TOKEN)")
+            return False
         else:
-            print(f"  ❌ Upload failed")
+            print(f"⚠️ Could not check repository: {repo_status}")
+        
+        # Find the commit the upload will be based on
+        base_commit_sha, base_tree_sha = await get_branch_head(session, repo_api)
+        if base_tree_sha is MISSING_BRANCH:
+            print(f"📋 {BRANCH} branch has no commits yet, creating an initial commit...")
+            if not await seed_empty_branch(session, repo_api, github_repo):
+                return False
+            base_commit_sha, base_tree_sha = await get_branch_head(session, repo_api)
+        if base_commit_sha is None:
+            print(f"❌ Could not read the {BRANCH} branch of {github_owner}/{github_repo}")
+            return False
+        
+        timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+        message = f"🚀 AJAI Trading Platform Update - {timestamp}"
+        
+        # Files whose content is already on the branch are skipped
+        print("📋 Scanning project files and uploading changes...")
+        with ThreadPoolExecutor(max_workers=FILE_IO_WORKERS) as executor:
+            scanned, total_files, success_count = await push_changes(
+                session, executor, repo_api, f"{github_owner}/{github_repo}",
+                base_commit_sha, base_tree_sha, message
+            )
+        print(f"📋 Scanned {scanned} files, {total_files} changed since the last push")
+        if not total_files:
+            print("ℹ️ No changes to push")
+            return True
+        if not success_count:
+            return False
     
     print()
     print(f"🎉 Upload complete! {success_count}/{total_files} files uploaded successfully")
@@ -146,7 +586,7 @@ def push_to_github():
 
 if __name__ == "__main__":
     try:
-        success = push_to_github()
+        success = asyncio.run(push_to_github())
         if not success:
             print("\n❌ Upload to GitHub failed!")
             exit(1)
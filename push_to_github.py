@@ -5,26 +5,42 @@ import subprocess
 import sys
 from datetime import datetime
 
-def run_command(command, description, cwd=None):
-    """Run a command and handle errors"""
+# Commit identity passed per invocation instead of via separate `git config` calls
+GIT_IDENTITY = ["-c", "user.email=ajai-bot@example.com", "-c", "user.name=AJAI Bot"]
+
+def run_command(command, description, cwd=None, stream=False):
+    """Run a command and handle errors
+    
+    With stream=True the command writes straight to the terminal instead of
+    being captured, so long-running progress output (e.g. git push) is not buffered.
+    """
     print(f"📋 {description}...")
     try:
+        if stream:
+            subprocess.run(command, check=True, cwd=cwd)
+            print(f"✅ {description} completed")
+            return ""
         result = subprocess.run(
             command, 
-            shell=True, 
             check=True, 
             capture_output=True, 
             text=True,
-            cwd=cwd or os.getcwd()
+            cwd=cwd
         )
         print(f"✅ {description} completed")
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
         print(f"❌ {description} failed:")
-        print(f"Error: {e.stderr}")
+        if e.stderr:
+            print(f"Error: {e.stderr}")
         if e.stdout:
             print(f"Output: {e.stdout}")
         return None
+    except OSError as e:
+        # Without a shell, a missing executable raises instead of exiting 127
+        print(f"❌ {description} failed:")
+        print(f"Error: {e}")
+        return None
 
 def check_git_repo():
     """Check if git repository exists"""
@@ -55,42 +71,39 @@ def push_to_github():
     
     # Check if git is initialized
     if not check_git_repo():
-        if run_command("git init", "Initializing Git repository") is None:
+        if run_command(["git", "init"], "Initializing Git repository") is None:
             return False
-        if run_command("git branch -M main", "Setting main branch") is None:
+        if run_command(["git", "branch", "-M", "main"], "Setting main branch") is None:
             return False
     else:
         print("✅ Git repository already initialized")
         print()
     
-    # Configure git user
-    if run_command('git config user.email "ajai-bot@example.com"', "Setting Git email") is None:
-        print("⚠️ Could not set git email, continuing...")
-    
-    if run_command('git config user.name "AJAI Bot"', "Setting Git username") is None:
-        print("⚠️ Could not set git username, continuing...")
-    
     # Remove existing origin if it exists
-    subprocess.run("git remote remove origin", shell=True, capture_output=True)
-    print("ℹ️ Removed existing origin (if any)")
+    try:
+        subprocess.run(["git", "remote", "remove", "origin"], capture_output=True)
+        print("ℹ️ Removed existing origin (if any)")
+    except OSError:
+        # git itself is missing; adding the remote below reports the failure
+        pass
     
     # Add remote origin with token authentication
     remote_url = f"https://{github_token}@github.com/{github_owner}/{github_repo}.git"
-    if run_command(f'git remote add origin {remote_url}', "Adding GitHub remote") is None:
+    if run_command(["git", "remote", "add", "origin", remote_url], "Adding GitHub remote") is None:
         return False
     
     # Add all files
-    if run_command("git add .", "Adding all files") is None:
+    if run_command(["git", "add", "."], "Adding all files") is None:
         return False
     
-    # Check if there are changes to commit
-    try:
-        result = subprocess.run("git diff-index --quiet HEAD --", shell=True, check=True)
+    # Check if there are changes to commit (any porcelain output means there are)
+    status = subprocess.run(
+        ["git", "status", "--porcelain=v2", "-z", "--untracked-files=no"],
+        capture_output=True
+    )
+    if status.returncode == 0 and not status.stdout:
         print("ℹ️ No changes to commit")
         return True
-    except subprocess.CalledProcessError:
-        # There are changes to commit
-        pass
     
     # Create detailed commit message
     timestamp = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S')
@@ -116,13 +129,13 @@ def push_to_github():
 🚀 Ready for deployment and live trading!"""
     
     # Commit changes
-    if run_command(f'git commit -m "{commit_message}"', "Committing changes") is None:
+    if run_command(["git", *GIT_IDENTITY, "commit", "-m", commit_message], "Committing changes") is None:
         return False
     
     # Push to GitHub
-    if run_command("git push -u origin main", "Pushing to GitHub") is None:
+    if run_command(["git", "push", "-u", "origin", "main"], "Pushing to GitHub", stream=True) is None:
         print("⚠️ Push failed, trying force push...")
-        if run_command("git push -f origin main", "Force pushing to GitHub") is None:
+        if run_command(["git", "push", "-f", "origin", "main"], "Force pushing to GitHub", stream=True) is None:
             return False
     
     print()